@@ -7,7 +7,8 @@ from __future__ import annotations
 import functools
 import inspect
 import warnings
-from typing import AsyncGenerator, Callable, Literal, Union, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Iterator, Literal, cast
 
 import anyio
 from gradio_client.documentation import document
@@ -16,22 +17,50 @@ from gradio.blocks import Blocks
 from gradio.components import (
     Button,
     Chatbot,
-    Component,
     Markdown,
     MultimodalTextbox,
     State,
     Textbox,
     get_component_instance,
 )
-from gradio.components.chatbot import FileDataDict, Message, MessageDict, TupleFormat
+from gradio.components.chatbot import Message, MessageDict, TupleFormat
 from gradio.components.multimodal_textbox import MultimodalData
-from gradio.events import Dependency, on
+from gradio.events import on
+from gradio.exceptions import Error
 from gradio.helpers import create_examples as Examples  # noqa: N812
-from gradio.helpers import special_args
+from gradio.helpers import special_args, update
 from gradio.layouts import Accordion, Group, Row
 from gradio.routes import Request
-from gradio.themes import ThemeClass as Theme
-from gradio.utils import SyncToAsyncIterator, async_iteration, async_lambda
+from gradio.utils import (
+    async_iteration,
+    iterate_in_thread,
+    throttle_async_iterator,
+)
+
+# Names used in the annotations of event handlers (e.g. Request, TupleFormat) must be imported
+# at runtime, since Blocks resolves those annotations to find where to inject a gr.Request.
+if TYPE_CHECKING:
+    from gradio.components import Component
+    from gradio.components.chatbot import FileDataDict
+    from gradio.data_classes import FileData
+    from gradio.events import Dependency
+    from gradio.themes import ThemeClass as Theme
+
+# Minimum number of seconds between chatbot updates while a response is streaming
+STREAM_THROTTLE_INTERVAL = 0.03
+
+
+def _file_data_as_dict(file: FileData) -> FileDataDict:
+    # FileData only has flat fields, so copying them directly is equivalent to, and
+    # an order of magnitude faster than, the schema walk done by model_dump()
+    return {**file.__dict__, "meta": dict(file.meta)}  # type: ignore
+
+
+def _last_item(iterator: Iterator):
+    item = None
+    for item in iterator:  # noqa: B007
+        pass
+    return item
 
 
 @document()
@@ -128,15 +157,43 @@ class ChatInterface(Blocks):
             delete_cache=delete_cache,
         )
         self.msg_format: Literal["messages", "tuples"] = msg_format
+        self._append_multimodal_history = (
+            self._append_multimodal_history_tuples
+            if self.msg_format == "tuples"
+            else self._append_multimodal_history_messages
+        )
         self.multimodal = multimodal
-        self.concurrency_limit = concurrency_limit
+        self._display_input, self._stream_update, self._submit_update = {
+            ("tuples", False): (
+                self._display_input_text_tuples,
+                self._stream_update_text_tuples,
+                self._submit_update_text_tuples,
+            ),
+            ("messages", False): (
+                self._display_input_text_messages,
+                self._stream_update_text_messages,
+                self._submit_update_text_messages,
+            ),
+            ("tuples", True): (
+                self._display_input_multimodal,
+                self._stream_update_multimodal_tuples,
+                self._submit_update_multimodal_tuples,
+            ),
+            ("messages", True): (
+                self._display_input_multimodal,
+                self._stream_update_multimodal_messages,
+                self._submit_update_multimodal_messages,
+            ),
+        }[(self.msg_format, self.multimodal)]
+        self.concurrency_limit: int | None | Literal["default"] = concurrency_limit
         self.fn = fn
-        self.is_async = inspect.iscoroutinefunction(
-            self.fn
-        ) or inspect.isasyncgenfunction(self.fn)
-        self.is_generator = inspect.isgeneratorfunction(
-            self.fn
-        ) or inspect.isasyncgenfunction(self.fn)
+        is_async_gen = inspect.isasyncgenfunction(self.fn)
+        self.is_async = inspect.iscoroutinefunction(self.fn) or is_async_gen
+        self.is_generator = inspect.isgeneratorfunction(self.fn) or is_async_gen
+        # Coroutine functions are awaited directly, sync ones run in a worker thread
+        self._call_fn = self.fn if self.is_async else self._call_fn_in_thread
+        # Likewise, async generators are iterated directly and sync ones in a worker thread
+        self._open_stream = self.fn if self.is_async else self._open_stream_in_thread
         self.buttons: list[Button | None] = []
 
         self.examples = examples
@@ -151,6 +208,7 @@ class ChatInterface(Blocks):
             ]
         else:
             self.additional_inputs = []
+        self._needs_special_args = self._check_special_args()
         if additional_inputs_accordion_name is not None:
             print(
                 "The `additional_inputs_accordion_name` parameter is deprecated and will be removed in a future version of Gradio. Use the `additional_inputs_accordion` parameter instead."
@@ -205,12 +263,12 @@ class ChatInterface(Blocks):
             with Row():
                 for btn in [retry_btn, undo_btn, clear_btn]:
                     if btn is not None:
-                        if isinstance(btn, Button):
-                            btn.render()
-                        elif isinstance(btn, str):
+                        if isinstance(btn, str):
                             btn = Button(
                                 btn, variant="secondary", size="sm", min_width=60
                             )
+                        elif isinstance(btn, Button):
+                            btn.render()
                         else:
                             raise ValueError(
                                 f"All the _btn parameters must be a gr.Button, string, or None, not {type(btn)}"
@@ -250,24 +308,21 @@ class ChatInterface(Blocks):
                             autofocus=autofocus,
                         )
                     if submit_btn is not None and not multimodal:
-                        if isinstance(submit_btn, Button):
-                            submit_btn.render()
-                        elif isinstance(submit_btn, str):
+                        if isinstance(submit_btn, str):
                             submit_btn = Button(
                                 submit_btn,
                                 variant="primary",
                                 scale=1,
                                 min_width=150,
                             )
+                        elif isinstance(submit_btn, Button):
+                            submit_btn.render()
                         else:
                             raise ValueError(
                                 f"The submit_btn parameter must be a gr.Button, string, or None, not {type(submit_btn)}"
                             )
                     if stop_btn is not None:
-                        if isinstance(stop_btn, Button):
-                            stop_btn.visible = False
-                            stop_btn.render()
-                        elif isinstance(stop_btn, str):
+                        if isinstance(stop_btn, str):
                             stop_btn = Button(
                                 stop_btn,
                                 variant="stop",
@@ -275,6 +330,9 @@ class ChatInterface(Blocks):
                                 scale=1,
                                 min_width=150,
                             )
+                        elif isinstance(stop_btn, Button):
+                            stop_btn.visible = False
+                            stop_btn.render()
                         else:
                             raise ValueError(
                                 f"The stop_btn parameter must be a gr.Button, string, or None, not {type(stop_btn)}"
@@ -307,27 +365,64 @@ class ChatInterface(Blocks):
                     examples_per_page=examples_per_page,
                 )
 
-            any_unrendered_inputs = any(
-                not inp.is_rendered for inp in self.additional_inputs
-            )
-            if self.additional_inputs and any_unrendered_inputs:
+            unrendered_inputs = [
+                inp for inp in self.additional_inputs if not inp.is_rendered
+            ]
+            if unrendered_inputs:
                 with Accordion(**self.additional_inputs_accordion_params):  # type: ignore
-                    for input_component in self.additional_inputs:
-                        if not input_component.is_rendered:
-                            input_component.render()
+                    for input_component in unrendered_inputs:
+                        input_component.render()
 
             # The example caching must happen after the input components have rendered
             if examples:
+                if self.is_generator and self.examples_handler.cache_examples is True:
+                    # Eagerly cached examples only store the final response, so there is
+                    # no need to build a chatbot update for every chunk
+                    self.examples_handler.fn = self._examples_final_fn
                 self.examples_handler._start_caching()
 
             self.saved_input = State()
             self.chatbot_state = (
                 State(self.chatbot.value) if self.chatbot.value else State([])
             )
-            self.show_progress = show_progress
+            self.show_progress: Literal["full", "minimal", "hidden"] = show_progress
+            # The submit and stop buttons swap visibility while a response is streaming; the
+            # updates are built once here rather than on every submission.
+            hide_btn, show_btn = update(visible=False), update(visible=True)
+            if self.submit_btn:
+                self._stream_start_updates = (hide_btn, show_btn)
+                self._stream_end_updates = (show_btn, hide_btn)
+            else:
+                self._stream_start_updates = show_btn
+                self._stream_end_updates = hide_btn
             self._setup_events()
             self._setup_api()
 
+    def _check_special_args(self) -> bool:
+        # The signature of self.fn does not change, so check once whether special_args would
+        # modify its inputs (e.g. to inject a gr.Request) instead of inspecting it on every call.
+        num_inputs = 2 + len(self.additional_inputs)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                inputs, _, _ = special_args(self.fn, inputs=[None] * num_inputs)
+            except Error:
+                return True
+        return len(inputs) != num_inputs
+
+    async def _call_fn_in_thread(self, *inputs):
+        return await anyio.to_thread.run_sync(self.fn, *inputs, limiter=self.limiter)
+
+    def _open_stream_in_thread(self, *inputs) -> AsyncGenerator:
+        # Calling a generator function does not run any of its body, so only the
+        # iteration needs to happen in a worker thread
+        return iterate_in_thread(self.fn(*inputs), self.limiter)
+
+    def _fill_special_args(self, inputs: list, request: Request | None) -> list:
+        if self._needs_special_args:
+            inputs, _, _ = special_args(self.fn, inputs=inputs, request=request)
+        return inputs
+
     def _setup_events(self) -> None:
         submit_fn = self._stream_fn if self.is_generator else self._submit_fn
         submit_triggers = (
@@ -335,35 +430,40 @@ class ChatInterface(Blocks):
             if self.submit_btn
             else [self.textbox.submit]
         )
-        submit_event = (
-            on(
+        if self.multimodal:
+            # MultimodalTextbox.preprocess() reduces the files to bare paths, so the
+            # raw payload has to be saved in its own step before it is displayed.
+            display_event = on(
                 submit_triggers,
-                self._clear_and_save_textbox,
+                self._clear_and_save_multimodal_textbox,
                 [self.textbox],
                 [self.textbox, self.saved_input],
                 show_api=False,
                 queue=False,
                 preprocess=False,
-            )
-            .then(
+            ).then(
                 self._display_input,
                 [self.saved_input, self.chatbot_state],
                 [self.chatbot, self.chatbot_state],
                 show_api=False,
                 queue=False,
             )
-            .then(
-                submit_fn,
-                [self.saved_input, self.chatbot_state] + self.additional_inputs,
-                [self.chatbot, self.chatbot_state],
+        else:
+            display_event = on(
+                submit_triggers,
+                self._clear_save_and_display_text,
+                [self.textbox, self.chatbot_state],
+                [self.textbox, self.saved_input, self.chatbot, self.chatbot_state],
                 show_api=False,
-                concurrency_limit=cast(
-                    Union[int, Literal["default"], None], self.concurrency_limit
-                ),
-                show_progress=cast(
-                    Literal["full", "minimal", "hidden"], self.show_progress
-                ),
+                queue=False,
             )
+        submit_event = display_event.then(
+            submit_fn,
+            [self.saved_input, self.chatbot_state] + self.additional_inputs,
+            [self.chatbot, self.chatbot_state],
+            show_api=False,
+            concurrency_limit=self.concurrency_limit,
+            show_progress=self.show_progress,
         )
         self._setup_stop_events(submit_triggers, submit_event)
 
@@ -388,12 +488,8 @@ class ChatInterface(Blocks):
                     [self.saved_input, self.chatbot_state] + self.additional_inputs,
                     [self.chatbot, self.chatbot_state],
                     show_api=False,
-                    concurrency_limit=cast(
-                        Union[int, Literal["default"], None], self.concurrency_limit
-                    ),
-                    show_progress=cast(
-                        Literal["full", "minimal", "hidden"], self.show_progress
-                    ),
+                    concurrency_limit=self.concurrency_limit,
+                    show_progress=self.show_progress,
                 )
             )
             self._setup_stop_events([self.retry_btn.click], retry_event)
@@ -421,7 +517,7 @@ class ChatInterface(Blocks):
 
         if self.clear_btn:
             self.clear_btn.click(
-                async_lambda(lambda: ([], [], None)),
+                self._clear_chat,
                 None,
                 [self.chatbot, self.chatbot_state, self.saved_input],
                 queue=False,
@@ -432,43 +528,24 @@ class ChatInterface(Blocks):
         self, event_triggers: list[Callable], event_to_cancel: Dependency
     ) -> None:
         if self.stop_btn and self.is_generator:
-            if self.submit_btn:
-                for event_trigger in event_triggers:
-                    event_trigger(
-                        async_lambda(
-                            lambda: (
-                                Button(visible=False),
-                                Button(visible=True),
-                            )
-                        ),
-                        None,
-                        [self.submit_btn, self.stop_btn],
-                        show_api=False,
-                        queue=False,
-                    )
-                event_to_cancel.then(
-                    async_lambda(lambda: (Button(visible=True), Button(visible=False))),
-                    None,
-                    [self.submit_btn, self.stop_btn],
-                    show_api=False,
-                    queue=False,
-                )
-            else:
-                for event_trigger in event_triggers:
-                    event_trigger(
-                        async_lambda(lambda: Button(visible=True)),
-                        None,
-                        [self.stop_btn],
-                        show_api=False,
-                        queue=False,
-                    )
-                event_to_cancel.then(
-                    async_lambda(lambda: Button(visible=False)),
+            stream_btns = (
+                [self.submit_btn, self.stop_btn] if self.submit_btn else [self.stop_btn]
+            )
+            for event_trigger in event_triggers:
+                event_trigger(
+                    self._on_stream_start,
                     None,
-                    [self.stop_btn],
+                    stream_btns,
                     show_api=False,
                     queue=False,
                 )
+            event_to_cancel.then(
+                self._on_stream_end,
+                None,
+                stream_btns,
+                show_api=False,
+                queue=False,
+            )
             self.stop_btn.click(
                 None,
                 None,
@@ -477,102 +554,223 @@ class ChatInterface(Blocks):
                 show_api=False,
             )
 
+    async def _clear_chat(self) -> tuple[list, list, None]:
+        return [], [], None
+
+    async def _on_stream_start(self) -> tuple[dict, dict] | dict:
+        return self._stream_start_updates
+
+    async def _on_stream_end(self) -> tuple[dict, dict] | dict:
+        return self._stream_end_updates
+
     def _setup_api(self) -> None:
+        # The endpoint wraps fn so that it takes on fn's signature: the /chat API then
+        # reports fn's own parameter names and defaults, and Blocks fills in any
+        # gr.Request, gr.Progress, etc. that fn asks for before calling the endpoint.
         if self.is_generator:
 
             @functools.wraps(self.fn)
-            async def api_fn(message, history, *args, **kwargs):  # type: ignore
-                if self.is_async:
-                    generator = self.fn(message, history, *args, **kwargs)
-                else:
-                    generator = await anyio.to_thread.run_sync(
-                        self.fn, message, history, *args, **kwargs, limiter=self.limiter
-                    )
-                    generator = SyncToAsyncIterator(generator, self.limiter)
-                try:
-                    first_response = await async_iteration(generator)
-                    yield first_response, history + [[message, first_response]]
-                except StopIteration:
-                    yield None, history + [[message, None]]
-                async for response in generator:
-                    yield response, history + [[message, response]]
+            async def api_fn(message, history, *args):  # type: ignore
+                async for output in self._api_stream_fn(message, history, *args):
+                    yield output
+
         else:
 
             @functools.wraps(self.fn)
-            async def api_fn(message, history, *args, **kwargs):
-                if self.is_async:
-                    response = await self.fn(message, history, *args, **kwargs)
-                else:
-                    response = await anyio.to_thread.run_sync(
-                        self.fn, message, history, *args, **kwargs, limiter=self.limiter
-                    )
-                history.append([message, response])
-                return response, history
+            async def api_fn(message, history, *args):
+                return await self._api_submit_fn(message, history, *args)
 
         self.fake_api_btn.click(
             api_fn,
             [self.textbox, self.chatbot_state] + self.additional_inputs,
             [self.textbox, self.chatbot_state],
             api_name="chat",
-            concurrency_limit=cast(
-                Union[int, Literal["default"], None], self.concurrency_limit
-            ),
+            concurrency_limit=self.concurrency_limit,
         )
 
-    def _clear_and_save_textbox(
-        self, message: str | dict
-    ) -> tuple[str | dict, str | MultimodalData]:
-        if self.multimodal:
-            return {"text": "", "files": []}, MultimodalData(**cast(dict, message))
-        else:
-            return "", cast(str, message)
+    def _clear_and_save_multimodal_textbox(
+        self, message: dict
+    ) -> tuple[dict, MultimodalData]:
+        return {"text": "", "files": []}, MultimodalData(**message)
+
+    async def _clear_save_and_display_text(
+        self, message: str, history: TupleFormat | list[MessageDict]
+    ) -> tuple[
+        str, str, TupleFormat | list[MessageDict], TupleFormat | list[MessageDict]
+    ]:
+        chatbot, history = await self._display_input(message, history)  # type: ignore
+        return "", message, chatbot, history
 
-    def _append_multimodal_history(
+    def _append_multimodal_history_tuples(
         self,
         message: MultimodalData,
-        response: MessageDict | str | None,
-        history: list[MessageDict] | TupleFormat,
+        response: str | None,
+        history: TupleFormat,
     ):
-        if self.msg_format == "tuples":
-            for x in message.files:
-                history.append([(x.path,), None])  # type: ignore
-            if message.text is None or not isinstance(message.text, str):
-                return
-            elif message.text == "" and message.files != []:
-                history.append([None, response])  # type: ignore
-            else:
-                history.append([message.text, cast(str, response)])  # type: ignore
+        for x in message.files:
+            history.append([(x.path,), None])
+        if message.text is None or not isinstance(message.text, str):
+            return
+        elif message.text == "" and message.files:
+            history.append([None, response])
         else:
-            for x in message.files:
-                history.append(
-                    {"role": "user", "content": cast(FileDataDict, x.model_dump())}  # type: ignore
-                )
-            if message.text is None or not isinstance(message.text, str):
-                return
-            else:
-                history.append({"role": "user", "content": message.text})  # type: ignore
-            if response:
-                history.append(cast(MessageDict, response))  # type: ignore
+            history.append([message.text, response])
 
-    async def _display_input(
+    def _append_multimodal_history_messages(
+        self,
+        message: MultimodalData,
+        response: MessageDict | None,
+        history: list[MessageDict],
+    ):
+        for x in message.files:
+            history.append({"role": "user", "content": _file_data_as_dict(x)})
+        if message.text is None or not isinstance(message.text, str):
+            return
+        else:
+            history.append({"role": "user", "content": message.text})
+        if response:
+            history.append(response)
+
+    async def _display_input_text_tuples(
+        self, message: str, history: TupleFormat
+    ) -> tuple[TupleFormat, TupleFormat]:
+        history.append([message, None])
+        return history, history
+
+    async def _display_input_text_messages(
+        self, message: str, history: list[MessageDict]
+    ) -> tuple[list[MessageDict], list[MessageDict]]:
+        history.append({"role": "user", "content": message})
+        return history, history
+
+    async def _display_input_multimodal(
         self, message: str | MultimodalData, history: TupleFormat | list[MessageDict]
     ) -> tuple[TupleFormat, TupleFormat] | tuple[list[MessageDict], list[MessageDict]]:
-        if self.multimodal and isinstance(message, MultimodalData):
+        if isinstance(message, MultimodalData):
             self._append_multimodal_history(message, None, history)
-        elif isinstance(message, str) and self.msg_format == "tuples":
-            history.append([message, None])  # type: ignore
-        elif isinstance(message, str) and self.msg_format == "messages":
-            history.append({"role": "user", "content": message})  # type: ignore
-        return history, history  # type: ignore
+            return history, history  # type: ignore
+        # e.g. when retrying without a saved input
+        elif self.msg_format == "tuples":
+            return await self._display_input_text_tuples(message, history)  # type: ignore
+        else:
+            return await self._display_input_text_messages(message, history)  # type: ignore
+
+    # The _stream_update_* methods build the first update of a stream. They copy the
+    # history rather than appending to it, since fn's generator still holds it.
+    def _stream_update_text_tuples(
+        self, history: TupleFormat, message: str, response: str | None
+    ) -> TupleFormat:
+        return history + [[message, response]]
+
+    def _stream_update_text_messages(
+        self, history: list[MessageDict], message: str, response: MessageDict | None
+    ) -> list[MessageDict]:
+        return history + [{"role": "user", "content": message}, response]  # type: ignore
+
+    def _stream_update_multimodal_tuples(
+        self,
+        history: TupleFormat,
+        message: str | MultimodalData,
+        response: str | None,
+    ) -> TupleFormat:
+        if not isinstance(message, MultimodalData):
+            return self._stream_update_text_tuples(history, message, response)
+        update = history.copy()
+        update.extend([(x.path,), None] for x in message.files)
+        update.append([message.text, response])
+        return update
+
+    def _stream_update_multimodal_messages(
+        self,
+        history: list[MessageDict],
+        message: str | MultimodalData,
+        response: MessageDict | None,
+    ) -> list[MessageDict]:
+        if not isinstance(message, MultimodalData):
+            return self._stream_update_text_messages(history, message, response)
+        update = history.copy()
+        update.extend(
+            {"role": "user", "content": _file_data_as_dict(x)}  # type: ignore
+            for x in message.files
+        )
+        update.append({"role": "user", "content": message.text})  # type: ignore
+        update.append(response)  # type: ignore
+        return update
+
+    # The _submit_update_* methods add a finished turn to the history in place
+    def _submit_update_text_tuples(
+        self, history: TupleFormat, message: str, response: str | None
+    ) -> None:
+        history.append([message, response])
+
+    def _submit_update_text_messages(
+        self,
+        history: list[MessageDict],
+        message: str,
+        response: MessageDict | Message | str | None,
+    ) -> None:
+        history.extend(
+            [{"role": "user", "content": message}, self.response_as_dict(response)]  # type: ignore
+        )
+
+    def _submit_update_multimodal_tuples(
+        self,
+        history: TupleFormat,
+        message: str | MultimodalData,
+        response: str | None,
+    ) -> None:
+        if not isinstance(message, MultimodalData):
+            return self._submit_update_text_tuples(history, message, response)
+        self._append_multimodal_history_tuples(message, response, history)
+
+    def _submit_update_multimodal_messages(
+        self,
+        history: list[MessageDict],
+        message: str | MultimodalData,
+        response: MessageDict | Message | str | None,
+    ) -> None:
+        if not isinstance(message, MultimodalData):
+            return self._submit_update_text_messages(history, message, response)
+        self._append_multimodal_history_messages(
+            message,
+            self.response_as_dict(response),  # type: ignore
+            history,
+        )
+
+    def _trim_count(self, message: str | MultimodalData | None) -> int:
+        # The number of history entries that _display_input added for message
+        if self.multimodal and isinstance(message, MultimodalData):
+            n_files = len(message.files)
+            return n_files + 1 if message.text is not None else n_files
+        return 1
+
+    @staticmethod
+    @contextmanager
+    def _without_pending_input(
+        history_with_input: TupleFormat | list[MessageDict], remove_input: int
+    ) -> Iterator[TupleFormat | list[MessageDict]]:
+        # Truncate the input added by _display_input off the end of the chat history in place
+        # rather than copying the whole conversation, and put it back if the call to fn fails
+        # so that the chatbot state stays in sync with what is displayed.
+        pending_input = history_with_input[-remove_input:]
+        del history_with_input[-remove_input:]
+        num_committed = len(history_with_input)
+        try:
+            yield history_with_input
+        except BaseException:
+            del history_with_input[num_committed:]
+            history_with_input.extend(pending_input)  # type: ignore
+            raise
 
     def response_as_dict(self, response: MessageDict | Message | str) -> MessageDict:
-        if isinstance(response, Message):
-            new_response = response.model_dump()
-        elif isinstance(response, str):
+        # Streamed responses are almost always strings, so check for those first
+        if isinstance(response, str):
             return {"role": "assistant", "content": response}
-        else:
-            new_response = response
-        return cast(MessageDict, new_response)
+        elif isinstance(response, dict):
+            return response  # type: ignore
+        elif isinstance(response, Message):
+            return cast(MessageDict, response.model_dump())
+        return response  # type: ignore
 
     async def _submit_fn(
         self,
@@ -582,40 +780,19 @@ class ChatInterface(Blocks):
         *args,
     ) -> tuple[TupleFormat, TupleFormat] | tuple[list[MessageDict], list[MessageDict]]:
         if self.multimodal and isinstance(message, MultimodalData):
-            remove_input = (
-                len(message.files) + 1
-                if message.text is not None
-                else len(message.files)
-            )
-            history = history_with_input[:-remove_input]
             message_serialized = message.model_dump()
         else:
-            history = history_with_input[:-1]
             message_serialized = message
 
-        inputs, _, _ = special_args(
-            self.fn, inputs=[message_serialized, history, *args], request=request
-        )
-
-        if self.is_async:
-            response = await self.fn(*inputs)
-        else:
-            response = await anyio.to_thread.run_sync(
-                self.fn, *inputs, limiter=self.limiter
+        remove_input = self._trim_count(message)
+        with self._without_pending_input(history_with_input, remove_input) as history:
+            inputs = self._fill_special_args(
+                [message_serialized, history, *args], request
             )
 
-        if self.msg_format == "messages":
-            new_response = self.response_as_dict(response)
-        else:
-            new_response = response
-
-        if self.multimodal and isinstance(message, MultimodalData):
-            self._append_multimodal_history(message, new_response, history)  # type: ignore
-        elif isinstance(message, str) and self.msg_format == "tuples":
-            history.append([message, new_response])  # type: ignore
-        elif isinstance(message, str) and self.msg_format == "messages":
-            history.extend([{"role": "user", "content": message}, new_response])  # type: ignore
-        return history, history  # type: ignore
+            response = await self._call_fn(*inputs)
+            self._submit_update(history, message, response)  # type: ignore
+            return history, history  # type: ignore
 
     async def _stream_fn(
         self,
@@ -624,113 +801,47 @@ class ChatInterface(Blocks):
         request: Request,
         *args,
     ) -> AsyncGenerator:
-        if self.multimodal and isinstance(message, MultimodalData):
-            remove_input = (
-                len(message.files) + 1
-                if message.text is not None
-                else len(message.files)
-            )
-            history = history_with_input[:-remove_input]
-        else:
-            history = history_with_input[:-1]
-        inputs, _, _ = special_args(
-            self.fn, inputs=[message, history, *args], request=request
-        )
-
-        if self.is_async:
-            generator = self.fn(*inputs)
-        else:
-            generator = await anyio.to_thread.run_sync(
-                self.fn, *inputs, limiter=self.limiter
-            )
-            generator = SyncToAsyncIterator(generator, self.limiter)
-        try:
-            first_response = await async_iteration(generator)
+        remove_input = self._trim_count(message)
+        with self._without_pending_input(history_with_input, remove_input) as history:
+            inputs = self._fill_special_args([message, history, *args], request)
+
+            generator = self._open_stream(*inputs)
+            # The chatbot cannot usefully render faster than this, so chunks that arrive
+            # sooner are coalesced rather than each sending the whole chatbot to the browser
+            generator = throttle_async_iterator(generator, STREAM_THROTTLE_INTERVAL)
+            try:
+                first_response = await async_iteration(generator)
+            except StopAsyncIteration:
+                # fn did not yield anything, so only the user's input is kept
+                update = self._stream_update(history, message, None)
+                if self.msg_format == "messages":
+                    update.pop()
+                yield update, update
+                return
             if self.msg_format == "messages":
                 first_response = self.response_as_dict(first_response)
-            if (
-                self.multimodal
-                and isinstance(message, MultimodalData)
-                and self.msg_format == "tuples"
-            ):
-                for x in message.files:
-                    history.append([(x,), None])  # type: ignore
-                update = history + [[message.text, first_response]]
-                yield update, update
-            elif (
-                self.multimodal
-                and isinstance(message, MultimodalData)
-                and self.msg_format == "messages"
-            ):
-                for x in message.files:
-                    history.append(
-                        {"role": "user", "content": cast(FileDataDict, x.model_dump())}  # type: ignore
-                    )
-                update = history + [
-                    {"role": "user", "content": message.text},
-                    first_response,
-                ]
-                yield update, update
-            elif self.msg_format == "tuples":
-                update = history + [[message, first_response]]
-                yield update, update
-            else:
-                update = history + [
-                    {"role": "user", "content": message},
-                    first_response,
-                ]
-                yield update, update
-        except StopIteration:
-            if self.multimodal and isinstance(message, MultimodalData):
-                self._append_multimodal_history(message, None, history)
-                yield history, history
-            else:
-                update = history + [[message, None]]
-                yield update, update
-        async for response in generator:
+            update = self._stream_update(history, message, first_response)
+            yield update, update
+            # update already holds the history and the user's turn, so each chunk only
+            # replaces the response slot instead of copying the whole history again
             if self.msg_format == "messages":
-                response = self.response_as_dict(response)
-            if (
-                self.multimodal
-                and isinstance(message, MultimodalData)
-                and self.msg_format == "tuples"
-            ):
-                update = history + [[message.text, response]]
-                yield update, update
-            elif (
-                self.multimodal
-                and isinstance(message, MultimodalData)
-                and self.msg_format == "messages"
-            ):
-                update = history + [
-                    {"role": "user", "content": message.text},
-                    response,
-                ]
-                yield update, update
-            elif self.msg_format == "tuples":
-                update = history + [[message, response]]
-                yield update, update
+                as_dict = self.response_as_dict
+                async for response in generator:
+                    update[-1] = as_dict(response)
+                    yield update, update
             else:
-                update = history + [{"role": "user", "content": message}, response]
-                yield update, update
+                async for response in generator:
+                    update[-1][1] = response
+                    yield update, update
 
     async def _api_submit_fn(
         self,
         message: str,
         history: TupleFormat | list[MessageDict],
-        request: Request,
         *args,
     ) -> tuple[str, TupleFormat | list[MessageDict]]:
-        inputs, _, _ = special_args(
-            self.fn, inputs=[message, history, *args], request=request
-        )
-
-        if self.is_async:
-            response = await self.fn(*inputs)
-        else:
-            response = await anyio.to_thread.run_sync(
-                self.fn, *inputs, limiter=self.limiter
-            )
+        # The /chat endpoint has fn's signature, so args already hold fn's special args
+        response = await self._call_fn(message, history, *args)
         if self.msg_format == "tuples":
             history.append([message, response])  # type: ignore
         else:
@@ -739,51 +850,42 @@ class ChatInterface(Blocks):
         return response, history
 
     async def _api_stream_fn(
-        self, message: str, history: list[list[str | None]], request: Request, *args
+        self, message: str, history: list[list[str | None]], *args
     ) -> AsyncGenerator:
-        inputs, _, _ = special_args(
-            self.fn, inputs=[message, history, *args], request=request
-        )
-        if self.is_async:
-            generator = self.fn(*inputs)
+        generator = self._open_stream(message, history, *args)
+        # The history is copied once and only its last turn is replaced per chunk
+        if self.msg_format == "tuples":
+            update = history + [[message, None]]
         else:
-            generator = await anyio.to_thread.run_sync(
-                self.fn, *inputs, limiter=self.limiter
-            )
-            generator = SyncToAsyncIterator(generator, self.limiter)
+            update = history + [{"role": "user", "content": message}, None]  # type: ignore
         try:
             first_response = await async_iteration(generator)
-            if self.msg_format == "tuples":
-                yield first_response, history + [[message, first_response]]
-            else:
-                first_response = self.response_as_dict(first_response)
-                yield (
-                    first_response,
-                    history + [{"role": "user", "content": message}, first_response],
-                )
-        except StopIteration:
-            yield None, history + [[message, None]]
-        async for response in generator:
-            if self.msg_format == "tuples":
-                yield response, history + [[message, response]]
-            else:
-                new_response = self.response_as_dict(response)
-                yield (
-                    new_response,
-                    history + [{"role": "user", "content": message}, new_response],
-                )
+        except StopAsyncIteration:
+            if self.msg_format == "messages":
+                update.pop()
+            yield None, update
+            return
+        if self.msg_format == "tuples":
+            update[-1][1] = first_response
+        else:
+            update[-1] = self.response_as_dict(first_response)  # type: ignore
+        yield first_response, update
+        if self.msg_format == "tuples":
+            async for response in generator:
+                update[-1][1] = response
+                yield response, update
+        else:
+            as_dict = self.response_as_dict
+            async for response in generator:
+                update[-1] = as_dict(response)  # type: ignore
+                yield response, update
 
     async def _examples_fn(
         self, message: str, *args
     ) -> TupleFormat | list[MessageDict]:
-        inputs, _, _ = special_args(self.fn, inputs=[message, [], *args], request=None)
+        inputs = self._fill_special_args([message, [], *args], None)
 
-        if self.is_async:
-            response = await self.fn(*inputs)
-        else:
-            response = await anyio.to_thread.run_sync(
-                self.fn, *inputs, limiter=self.limiter
-            )
+        response = await self._call_fn(*inputs)
         if self.msg_format == "tuples":
             return [[message, response]]
         else:
@@ -794,21 +896,38 @@ class ChatInterface(Blocks):
         message: str,
         *args,
     ) -> AsyncGenerator:
-        inputs, _, _ = special_args(self.fn, inputs=[message, [], *args], request=None)
+        inputs = self._fill_special_args([message, [], *args], None)
+
+        generator = self._open_stream(*inputs)
+        if self.msg_format == "tuples":
+            async for response in generator:
+                yield [[message, response]]
+        else:
+            as_dict = self.response_as_dict
+            user_turn = {"role": "user", "content": message}
+            async for response in generator:
+                yield [user_turn, as_dict(response)]
+
+    async def _examples_final_fn(
+        self, message: str, *args
+    ) -> TupleFormat | list[MessageDict]:
+        inputs = self._fill_special_args([message, [], *args], None)
 
         if self.is_async:
-            generator = self.fn(*inputs)
+            response = None
+            async for response in self.fn(*inputs):  # noqa: B007
+                pass
         else:
-            generator = await anyio.to_thread.run_sync(
-                self.fn, *inputs, limiter=self.limiter
+            response = await anyio.to_thread.run_sync(
+                _last_item, self.fn(*inputs), limiter=self.limiter
             )
-            generator = SyncToAsyncIterator(generator, self.limiter)
-        async for response in generator:
-            if self.msg_format == "tuples":
-                yield [[message, response]]
-            else:
-                new_response = self.response_as_dict(response)
-                yield [{"role": "user", "content": message}, new_response]
+        if self.msg_format == "tuples":
+            return [[message, response]]
+        else:
+            return [
+                {"role": "user", "content": message},
+                self.response_as_dict(response),
+            ]
 
     async def _delete_prev_fn(
         self,
@@ -819,14 +938,7 @@ class ChatInterface(Blocks):
         str | MultimodalData,
         list[MessageDict] | TupleFormat,
     ]:
+        # In the messages format the response is a separate entry after the input
         extra = 1 if self.msg_format == "messages" else 0
-        if self.multimodal and isinstance(message, MultimodalData):
-            remove_input = (
-                len(message.files) + 1
-                if message.text is not None
-                else len(message.files)
-            ) + extra
-            history = history[:-remove_input]
-        else:
-            history = history[: -(1 + extra)]
+        del history[-(self._trim_count(message) + extra) :]
         return history, message or "", history
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from gradio_client.documentation import document
+
+from gradio.blocks import BlockContext
+from gradio.component_meta import ComponentMeta
+
+from gradio.events import Dependency
+
+@document()
+class Group(BlockContext, metaclass=ComponentMeta):
+    """
+    Group is a layout element within Blocks which groups together children so that
+    they do not have any padding or margin between them.
+    Example:
+        with gr.Group():
+            gr.Textbox(label="First")
+            gr.Textbox(label="Last")
+    """
+
+    EVENTS = []
+
+    def __init__(
+        self,
+        *,
+        visible: bool = True,
+        elem_id: str | None = None,
+        elem_classes: list[str] | str | None = None,
+        render: bool = True,
+    ):
+        """
+        Parameters:
+            visible: If False, group will be hidden.
+            elem_id: An optional string that is assigned as the id of this component in the HTML DOM. Can be used for targeting CSS styles.
+            elem_classes: An optional string or list of strings that are assigned as the class of this component in the HTML DOM. Can be used for targeting CSS styles.
+            render: If False, this layout will not be rendered in the Blocks context. Should be used if the intention is to assign event listeners now but render the component later.
+        """
+        BlockContext.__init__(
+            self,
+            visible=visible,
+            elem_id=elem_id,
+            elem_classes=elem_classes,
+            render=render,
+        )
\ No newline at end of file
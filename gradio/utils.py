@@ -34,6 +34,8 @@ from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
     Callable,
     Generic,
     Iterable,
@@ -656,6 +658,124 @@ class SyncToAsyncIterator:
         )
 
 
+async def iterate_in_thread(
+    iterator: Iterator, limiter: anyio.CapacityLimiter | None, maxsize: int = 16
+) -> AsyncGenerator:
+    """
+    Treat a synchronous iterator as an async generator. Unlike SyncToAsyncIterator, which
+    hops to a worker thread for every item, a single worker thread drains the iterator and
+    hands its items to the event loop. The worker can get at most `maxsize` items ahead of
+    the consumer, so the iterator is paused whenever the consumer falls behind.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    # Bounds how far the worker thread can get ahead of the consumer
+    slots = threading.Semaphore(maxsize)
+    closed = threading.Event()
+
+    def put(done: bool, item: Any) -> bool:
+        if closed.is_set():
+            return False
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, item))
+        except RuntimeError:
+            # The event loop is closed, so there is no consumer left
+            return False
+        return True
+
+    def produce():
+        error: BaseException | None = None
+        try:
+            for item in iterator:
+                slots.acquire()
+                if not put(False, item):
+                    break
+        except BaseException as e:
+            error = e
+        finally:
+            put(True, error)
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    def on_producer_done(task: asyncio.Future):
+        # Ends the stream if the worker failed before it could post its own sentinel
+        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+        queue.put_nowait((True, error))
+
+    producer = asyncio.ensure_future(anyio.to_thread.run_sync(produce, limiter=limiter))
+    producer.add_done_callback(on_producer_done)
+    try:
+        while True:
+            done, item = await queue.get()
+            if done:
+                if item is not None:
+                    raise item
+                return
+            slots.release()
+            yield item
+    finally:
+        closed.set()
+        # Wake the worker thread if it is waiting for a free slot so that it can stop
+        slots.release()
+
+
+async def throttle_async_iterator(
+    iterator: AsyncIterator, interval: float
+) -> AsyncGenerator:
+    """
+    Yields items from an async iterator at most once every `interval` seconds, dropping any
+    intermediate items that arrive sooner. The most recent item is always yielded, either
+    once the interval has elapsed or when the iterator ends or raises, so no final value is
+    lost. The iterator is driven from a single task for its whole lifetime, so cancel scopes
+    and context variables held across its yields keep working.
+    """
+    loop = asyncio.get_running_loop()
+    no_item = object()
+    latest: Any = no_item
+    error: Exception | None = None
+    finished = False
+    ready = asyncio.Event()
+
+    async def pump():
+        nonlocal latest, error, finished
+        try:
+            async for item in iterator:
+                latest = item
+                ready.set()
+                # Let the consumer pick up the item even if the iterator never awaits
+                await asyncio.sleep(0)
+        except Exception as e:
+            error = e
+        finally:
+            try:
+                if hasattr(iterator, "aclose"):
+                    await iterator.aclose()
+            finally:
+                finished = True
+                ready.set()
+
+    task = asyncio.ensure_future(pump())
+    last_yield = float("-inf")
+    try:
+        while not (finished and latest is no_item):
+            await ready.wait()
+            if not finished:
+                delay = last_yield + interval - loop.time()
+                if delay > 0:
+                    await asyncio.wait({task}, timeout=delay)
+            ready.clear()
+            if latest is not no_item:
+                item, latest = latest, no_item
+                yield item
+                last_yield = loop.time()
+        if error is not None:
+            raise error
+    finally:
+        if not task.done():
+            task.cancel()
+        await asyncio.wait({task})
+
+
 async def async_iteration(iterator):
     # anext not introduced until 3.10 :(
     return await iterator.__anext__()
@@ -1,11 +1,18 @@
+import asyncio
+import copy
 import tempfile
 from concurrent.futures import wait
 from pathlib import Path
 from unittest.mock import patch
 
+import anyio
 import pytest
 
 import gradio as gr
+from gradio.chat_interface import _file_data_as_dict
+from gradio.components.multimodal_textbox import MultimodalData
+from gradio.data_classes import FileData
+from gradio.state_holder import SessionState
 
 
 def invalid_fn(message):
@@ -102,6 +109,26 @@ class TestInit:
                 None,
             )
 
+    def test_text_submit_displays_input_in_one_event(self):
+        chatbot = gr.ChatInterface(double)
+        dependencies = list(chatbot.fns.values())
+        textbox = chatbot.textbox._id
+        submit_btn = chatbot.submit_btn._id
+        display = next(
+            d
+            for d in dependencies
+            if d.targets == [(textbox, "submit"), (submit_btn, "click")]
+        )
+        assert not display.queue
+        assert [o._id for o in display.outputs] == [
+            textbox,
+            chatbot.saved_input._id,
+            chatbot.chatbot._id,
+            chatbot.chatbot_state._id,
+        ]
+        submit = next(d for d in dependencies if d.trigger_after == display._id)
+        assert submit.fn == chatbot._submit_fn
+
     def test_example_caching(self):
         with patch(
             "gradio.utils.get_cache_folder", return_value=Path(tempfile.mkdtemp())
@@ -227,6 +254,141 @@ class TestInit:
             assert prediction_hello[0].root[0] == ("hello", "robot hello")
             assert prediction_hi[0].root[0] == ("hi", "ro")
 
+    def test_special_args_only_checked_when_needed(self):
+        def greet_user(message, history, request: gr.Request):
+            return f"hi, {request.username}"
+
+        assert not gr.ChatInterface(double)._needs_special_args
+        chatbot = gr.ChatInterface(greet_user)
+        assert chatbot._needs_special_args
+
+    @pytest.mark.asyncio
+    async def test_request_passed_to_fn(self):
+        def greet_user(message, history, request: gr.Request):
+            return f"hi, {request.username}"
+
+        chatbot = gr.ChatInterface(greet_user)
+        request = gr.Request(username="abubakar")
+        history, _ = await chatbot._submit_fn("hello", [["hello", None]], request)
+        assert history == [["hello", "hi, abubakar"]]
+
+    @pytest.mark.asyncio
+    async def test_history_restored_when_fn_fails(self):
+        def fail(message, history):
+            raise ValueError("oops")
+
+        chatbot = gr.ChatInterface(fail)
+        history = [["hi", "hello"], ["how are you?", None]]
+        with pytest.raises(ValueError):
+            await chatbot._submit_fn("how are you?", history, None)
+        assert history == [["hi", "hello"], ["how are you?", None]]
+
+    @pytest.mark.asyncio
+    async def test_multimodal_submit(self):
+        def double_text(message, history):
+            return double(message["text"], history)
+
+        chatbot = gr.ChatInterface(double_text, multimodal=True)
+        message = MultimodalData(text="hi", files=[FileData(path="cat.png")])
+        _, history = await chatbot._display_input(message, [])
+        history, _ = await chatbot._submit_fn(message, history, None)
+        assert history == [[("cat.png",), None], ["hi", "hi hi"]]
+
+        chatbot = gr.ChatInterface(double_text, multimodal=True, msg_format="messages")
+        _, history = await chatbot._display_input(message, [])
+        history, _ = await chatbot._submit_fn(message, history, None)
+        assert history == [
+            {"role": "user", "content": message.files[0].model_dump()},
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hi hi"},
+        ]
+
+    def test_file_data_as_dict_matches_model_dump(self):
+        file = FileData(path="cat.png", orig_name="cat.png", size=10)
+        assert _file_data_as_dict(file) == file.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_multimodal_stream_leaves_fn_history_untouched(self):
+        history_lengths = []
+
+        def stream(message, history):
+            for i in range(3):
+                history_lengths.append(len(history))
+                yield str(i)
+
+        chatbot = gr.ChatInterface(stream, multimodal=True)
+        message = MultimodalData(text="hi", files=[FileData(path="cat.png")])
+        history = [["hello", "hey"]]
+        _, history = await chatbot._display_input(message, history)
+        updates = [
+            update async for update, _ in chatbot._stream_fn(message, history, None)
+        ]
+        assert history_lengths == [1, 1, 1]
+        assert updates[-1][1:] == [[("cat.png",), None], ["hi", "2"]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("msg_format", ["tuples", "messages"])
+    async def test_stream_with_no_response(self, msg_format):
+        def no_response(message, history):
+            yield from []
+
+        chatbot = gr.ChatInterface(no_response, msg_format=msg_format)
+        user_turn = (
+            ["hi", None]
+            if msg_format == "tuples"
+            else {"role": "user", "content": "hi"}
+        )
+        _, history = await chatbot._display_input("hi", [])
+        updates = [u async for u, _ in chatbot._stream_fn("hi", history, None)]
+        assert updates == [[user_turn]]
+        api_updates = [(r, h) async for r, h in chatbot._api_stream_fn("hi", [])]
+        assert api_updates == [(None, [user_turn])]
+
+    @pytest.mark.asyncio
+    async def test_stream_with_cancel_scope_held_across_yields(self):
+        async def stream(message, history):
+            with anyio.fail_after(30):
+                for i in range(3):
+                    await asyncio.sleep(0.05)
+                    yield str(i)
+
+        chatbot = gr.ChatInterface(stream)
+        _, history = await chatbot._display_input("hi", [])
+        updates = [u async for u, _ in chatbot._stream_fn("hi", history, None)]
+        assert updates[-1] == [["hi", "2"]]
+
+    @pytest.mark.asyncio
+    async def test_stream_keeps_last_response_when_fn_fails(self):
+        async def stream(message, history):
+            yield "partial 1"
+            yield "partial 1 2"
+            raise gr.Error("oops")
+
+        chatbot = gr.ChatInterface(stream)
+        _, history = await chatbot._display_input("hi", [])
+        updates = []
+        with pytest.raises(gr.Error):
+            async for update, _ in chatbot._stream_fn("hi", history, None):
+                updates.append(copy.deepcopy(update))
+        assert updates[-1] == [["hi", "partial 1 2"]]
+
+    @pytest.mark.asyncio
+    async def test_delete_prev_trims_history_in_place(self):
+        chatbot = gr.ChatInterface(double, msg_format="messages")
+        history = [
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hi hi"},
+            {"role": "user", "content": "bye"},
+            {"role": "assistant", "content": "bye bye"},
+        ]
+        chat, message, state = await chatbot._delete_prev_fn("bye", history)
+        assert chat is state is history
+        assert history == [
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hi hi"},
+        ]
+        assert message == "bye"
+
     def test_custom_chatbot_with_events(self):
         with gr.Blocks() as demo:
             chatbot = gr.Chatbot()
@@ -247,6 +409,28 @@ class TestAPI:
         assert len(api_info["unnamed_endpoints"]) == 0
         assert "/chat" in api_info["named_endpoints"]
 
+    def test_api_info_uses_fn_parameter_names(self):
+        def chat(message, history, system_prompt, max_tokens=5):
+            return message
+
+        def chat_stream(message, history, system_prompt, max_tokens=5):
+            yield message
+
+        for fn in [chat, chat_stream]:
+            chatbot = gr.ChatInterface(fn, additional_inputs=["textbox", "slider"])
+            api_info = chatbot.get_api_info()
+            parameters = api_info["named_endpoints"]["/chat"]["parameters"]
+            assert [p["parameter_name"] for p in parameters] == [
+                "message",
+                "system_prompt",
+                "max_tokens",
+            ]
+            assert [p["parameter_has_default"] for p in parameters] == [
+                False,
+                False,
+                True,
+            ]
+
     @pytest.mark.parametrize("msg_format", ["tuples", "messages"])
     def test_streaming_api(self, msg_format, connect):
         chatbot = gr.ChatInterface(stream, msg_format=msg_format).queue()
@@ -296,3 +480,31 @@ class TestAPI:
                 "robot ",
                 "robot h",
             ]
+
+    @pytest.mark.asyncio
+    async def test_api_request_passed_to_fn(self):
+        def greet_user(message, history, request: gr.Request):
+            return f"hi, {request.username}"
+
+        chatbot = gr.ChatInterface(greet_user)
+        api_fn = next(fn for fn in chatbot.fns.values() if fn.api_name == "chat")
+        output = await chatbot.process_api(
+            block_fn=api_fn,
+            inputs=["hello", None],
+            state=SessionState(chatbot),
+            request=gr.Request(username="abubakar"),
+        )
+        assert output["data"][0] == "hi, abubakar"
+
+    @pytest.mark.asyncio
+    async def test_streaming_api_history_in_messages_format(self):
+        chatbot = gr.ChatInterface(stream, msg_format="messages")
+        api_fn = next(fn for fn in chatbot.fns.values() if fn.api_name == "chat").fn
+        outputs = [output async for output in api_fn("hi", [])]
+        assert outputs[-1] == (
+            "hi",
+            [
+                {"role": "user", "content": "hi"},
+                {"role": "assistant", "content": "hi"},
+            ],
+        )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 import os
 import sys
@@ -7,6 +9,7 @@ import warnings
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
 from typing_extensions import Literal
 
@@ -29,11 +32,13 @@ from gradio.utils import (
     ipython_check,
     is_in_or_equal,
     is_special_typed_parameter,
+    iterate_in_thread,
     kaggle_check,
     sagemaker_check,
     sanitize_list_for_csv,
     sanitize_value_for_csv,
     tex2svg,
+    throttle_async_iterator,
     validate_url,
 )
 
@@ -474,3 +479,147 @@ def test_parse_file_size():
     assert _parse_file_size("1kb") == 1 * FileSize.KB
     assert _parse_file_size("1mb") == 1 * FileSize.MB
     assert _parse_file_size("505 Mb") == 505 * FileSize.MB
+
+
+class TestIterateInThread:
+    @pytest.mark.asyncio
+    async def test_yields_all_items(self):
+        items = [item async for item in iterate_in_thread(iter(range(50)), None, 4)]
+        assert items == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self):
+        def fail():
+            yield 1
+            raise ValueError("oops")
+
+        items = []
+        with pytest.raises(ValueError, match="oops"):
+            async for item in iterate_in_thread(fail(), None):
+                items.append(item)
+        assert items == [1]
+
+    @pytest.mark.asyncio
+    async def test_base_exception_ends_stream(self):
+        class Abort(BaseException):
+            pass
+
+        def abort():
+            yield 1
+            raise Abort()
+
+        async def consume():
+            return [item async for item in iterate_in_thread(abort(), None)]
+
+        with pytest.raises(Abort):
+            await asyncio.wait_for(consume(), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_closing_stops_iterator(self):
+        closed = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def count():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                loop.call_soon_threadsafe(closed.set)
+
+        iterator = iterate_in_thread(count(), None, 2)
+        assert [await iterator.__anext__() for _ in range(3)] == [0, 1, 2]
+        await iterator.aclose()
+        await asyncio.wait_for(closed.wait(), timeout=5)
+
+
+class TestThrottleAsyncIterator:
+    @pytest.mark.asyncio
+    async def test_fast_items_are_coalesced(self):
+        async def count():
+            for i in range(100):
+                yield i
+
+        items = [item async for item in throttle_async_iterator(count(), 10)]
+        assert items == [0, 99]
+
+    @pytest.mark.asyncio
+    async def test_slow_items_are_not_dropped(self):
+        async def count():
+            for i in range(3):
+                await asyncio.sleep(0.05)
+                yield i
+
+        items = [item async for item in throttle_async_iterator(count(), 0.01)]
+        assert items == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pending_item_yielded_after_interval(self):
+        async def stall():
+            yield 0
+            yield 1
+            await asyncio.sleep(10)
+            yield 2
+
+        iterator = throttle_async_iterator(stall(), 0.05)
+        assert await iterator.__anext__() == 0
+        assert await asyncio.wait_for(iterator.__anext__(), timeout=1) == 1
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pending_item_yielded_before_error(self):
+        async def fail():
+            yield "partial 1"
+            yield "partial 1 2"
+            raise ValueError("oops")
+
+        items = []
+        with pytest.raises(ValueError, match="oops"):
+            async for item in throttle_async_iterator(fail(), 10):
+                items.append(item)
+        assert items == ["partial 1", "partial 1 2"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_scope_held_across_yields(self):
+        async def count():
+            with anyio.fail_after(30):
+                for i in range(3):
+                    await asyncio.sleep(0.01)
+                    yield i
+
+        items = [item async for item in throttle_async_iterator(count(), 0)]
+        assert items == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_context_variables_kept_across_yields(self):
+        var = contextvars.ContextVar("var", default=None)
+
+        async def read_var():
+            var.set("x")
+            for _ in range(3):
+                await asyncio.sleep(0.01)
+                yield var.get()
+
+        items = [item async for item in throttle_async_iterator(read_var(), 0)]
+        assert items == ["x", "x", "x"]
+
+    @pytest.mark.asyncio
+    async def test_closing_closes_source(self):
+        closed = False
+
+        async def count():
+            nonlocal closed
+            try:
+                i = 0
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield i
+                    i += 1
+            finally:
+                closed = True
+
+        iterator = throttle_async_iterator(count(), 0)
+        assert await iterator.__anext__() == 0
+        await iterator.aclose()
+        assert closed